@@ -0,0 +1,32 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools" / "benchmark"))
+import generators
+
+CASES = [
+    (generators.audit_log, "audit.jsonl", (500,)),
+    (generators.pr_diff, "pr.diff", (1000,)),
+    (generators.config, "openclaw.json", (20,)),
+    (generators.report_text, "report.md", (50_000,)),
+]
+
+
+@pytest.mark.parametrize("gen,name,args", CASES)
+def test_same_seed_is_byte_identical_and_seed_changes_output(tmp_path, gen, name, args):
+    a = gen(tmp_path / "a" / name, *args)
+    b = gen(tmp_path / "b" / name, *args)
+    other = gen(tmp_path / "a" / name, *args, seed=1)
+    assert generators.digest(a) == generators.digest(b)
+    assert other != a
+    assert generators.digest(other) != generators.digest(a)
+
+
+def test_cached_fixture_is_reused_only_for_the_same_parameters(tmp_path):
+    first = generators.audit_log(tmp_path / "audit.jsonl", 100)
+    mtime = first.stat().st_mtime_ns
+    assert generators.audit_log(tmp_path / "audit.jsonl", 100) == first
+    assert first.stat().st_mtime_ns == mtime
+    assert generators.audit_log(tmp_path / "audit.jsonl", 101) != first
@@ -0,0 +1,75 @@
+import argparse
+import json
+import pstats
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools" / "common"))
+import tracing
+
+
+@pytest.fixture
+def trace(tmp_path):
+    yield tmp_path / "trace.jsonl"
+    tracing.disable()
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+@tracing.traced()
+def work(x):
+    return x * 2
+
+
+def test_disabled_span_and_traced_write_nothing(trace):
+    tracing.enable("t", trace)
+    tracing.disable()
+    with tracing.span("stage", n=1):
+        assert work(2) == 4
+    assert tracing.span("stage") is tracing._NULL_SPAN
+    assert trace.read_text() == ""
+
+
+def test_nested_spans_record_parent(trace):
+    tracing.enable("t", trace)
+    with tracing.span("outer"):
+        with tracing.span("inner", url="x"):
+            work(1)
+    tracing.disable()
+    work_rec, inner, outer = _records(trace)
+    assert (work_rec["span"], work_rec["parent"]) == ("work", "inner")
+    assert (inner["parent"], inner["url"]) == ("outer", "x")
+    assert outer["parent"] is None and outer["tool"] == "t"
+
+
+def test_exit_and_error_are_recorded_and_reraised(trace):
+    tracing.enable("t", trace)
+    with pytest.raises(SystemExit):
+        with tracing.span("main"):
+            sys.exit(3)
+    with pytest.raises(ValueError):
+        with tracing.span("parse"):
+            raise ValueError("bad")
+    tracing.disable()
+    exited, failed = _records(trace)
+    assert exited["exit"] == 3 and "error" not in exited
+    assert failed["error"] == "ValueError"
+
+
+def test_run_profiled_writes_trace_and_stats(trace, tmp_path):
+    stats = tmp_path / "tool.prof"
+    args = argparse.Namespace(profile=str(trace), profile_stats=str(stats))
+    assert tracing.run_profiled(lambda: work(21), args, "tool") == 42
+    assert not tracing.enabled()
+    assert [(r["span"], r["tool"]) for r in _records(trace)] == [("work", "tool"), ("main", "tool")]
+    assert pstats.Stats(str(stats)).total_calls > 0
+
+
+def test_run_profiled_without_flags_just_calls_main(trace):
+    args = argparse.Namespace(profile=None, profile_stats=None)
+    assert tracing.run_profiled(lambda: 1, args, "tool") == 1
+    assert not trace.exists()
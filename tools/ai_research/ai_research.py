@@ -9,6 +9,7 @@ Usage:
 """
 
 import argparse
+import sys
 import urllib.request
 import urllib.parse
 import re
@@ -16,6 +17,9 @@ import html
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from tracing import add_profile_args, run_profiled, span, traced
+
 
 # ─────────────────────────────────────────────
 # Fetchers
@@ -26,16 +30,18 @@ def fetch(url, accept=None):
     if accept:
         headers["Accept"] = accept
     req = urllib.request.Request(url, headers=headers)
-    for attempt in range(3):
-        try:
-            with urllib.request.urlopen(req, timeout=15) as r:
-                return r.read().decode(errors="replace")
-        except Exception as e:
-            if attempt == 2:
-                return ""
-    return ""
-
-
+    with span("fetch", url=url):
+        for attempt in range(3):
+            try:
+                with urllib.request.urlopen(req, timeout=15) as r:
+                    return r.read().decode(errors="replace")
+            except Exception as e:
+                if attempt == 2:
+                    return ""
+        return ""
+
+
+@traced()
 def github_trending(since="daily", language=""):
     """Return list of {repo, url, description, stars_today}."""
     url = f"https://github.com/trending{('/' + language) if language else ''}?since={since}"
@@ -63,6 +69,7 @@ def github_trending(since="daily", language=""):
     return results
 
 
+@traced()
 def arxiv_papers(query, max_results=10):
     """Return list of {title, url, published, summary, authors}."""
     q = urllib.parse.quote(query)
@@ -97,6 +104,7 @@ def arxiv_papers(query, max_results=10):
 # Report generator
 # ─────────────────────────────────────────────
 
+@traced()
 def generate(repos, papers, keywords, since, top_n=5):
     date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
@@ -163,8 +171,12 @@ def main():
                         help="每个来源显示的条目数（默认：5）")
     parser.add_argument("--output", default=None,
                         help="输出 Markdown 文件路径（默认：打印到终端）")
+    add_profile_args(parser)
     args = parser.parse_args()
+    run_profiled(lambda: run(args), args, "ai_research")
+
 
+def run(args):
     print("📡 抓取 GitHub Trending...", flush=True)
     repos = github_trending(args.since, args.language)
     print(f"   找到 {len(repos)} 个项目")
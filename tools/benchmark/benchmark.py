@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+OpenClaw Benchmark Suite
+Runs every tool entry point against deterministic synthetic workloads (fully offline),
+measures wall time, throughput and the memory of the entry point itself
+(tracemalloc peak, RSS growth over setup), and compares against a stored baseline.
+
+Usage:
+    python3 benchmark.py                                # small scale, compare with baseline
+    python3 benchmark.py --scale medium --only "log_monitor.*"
+    python3 benchmark.py --save-baseline                # record current numbers as the baseline
+"""
+
+import argparse
+import fnmatch
+import io
+import json
+import multiprocessing
+import resource
+import shutil
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import generators
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+for _d in ("log_monitor", "heartbeat", "dashboard", "ai_research", "github_sync"):
+    sys.path.insert(0, str(TOOLS_DIR / _d))
+
+DATA_DIR = Path("/tmp/openclaw-bench")
+BASELINE_FILE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.25
+MEMORY_SLACK_KB = 1024  # 内存差异低于此值不算回退，避免小基准的噪声
+EXIT_ERROR = 1
+EXIT_REGRESSION = 2
+
+SCALES = {
+    "small": {
+        "audit_lines": 10_000, "daily_reports": 1_000, "trending_repos": 100, "arxiv_entries": 100,
+        "diff_lines": 10_000, "config_providers": 200, "report_bytes": 4 << 20, "sync_files": 2_000,
+        "heartbeat_agents": 100,
+    },
+    "medium": {
+        "audit_lines": 1_000_000, "daily_reports": 20_000, "trending_repos": 1_000, "arxiv_entries": 1_000,
+        "diff_lines": 1_000_000, "config_providers": 5_000, "report_bytes": 64 << 20, "sync_files": 20_000,
+        "heartbeat_agents": 1_000,
+    },
+    "large": {
+        "audit_lines": 10_000_000, "daily_reports": 100_000, "trending_repos": 5_000, "arxiv_entries": 5_000,
+        "diff_lines": 10_000_000, "config_providers": 20_000, "report_bytes": 512 << 20, "sync_files": 100_000,
+        "heartbeat_agents": 10_000,
+    },
+}
+
+
+# ─────────────────────────────────────────────
+# Workloads: prepare(data_dir, params) -> fixture path, run in the parent;
+#            setup(fixture, params) -> (fn, units, unit), run in the child
+# ─────────────────────────────────────────────
+
+def prep_audit(d, p):
+    return generators.audit_log(d / f"audit-{p['audit_lines']}.jsonl", p["audit_lines"])
+
+
+def prep_workspace(d, p):
+    n = p["daily_reports"]
+    return generators.workspace(d / f"workspace-{n}", reports=n // 10, daily=n, memory=n // 10)
+
+
+def prep_sync_tree(d, p):
+    n = p["sync_files"]
+    return generators.workspace(d / f"sync-src-{n}", reports=n // 4, daily=n // 2, memory=n // 4)
+
+
+def prep_trending(d, p):
+    return generators.trending_html(d / f"trending-{p['trending_repos']}.html", p["trending_repos"])
+
+
+def prep_arxiv(d, p):
+    return generators.arxiv_atom(d / f"arxiv-{p['arxiv_entries']}.xml", p["arxiv_entries"])
+
+
+def prep_diff(d, p):
+    return generators.pr_diff(d / f"pr-{p['diff_lines']}.diff", p["diff_lines"])
+
+
+def prep_config(d, p):
+    return generators.config(d / f"openclaw-{p['config_providers']}.json", p["config_providers"])
+
+
+def prep_report(d, p):
+    return generators.report_text(d / f"report-{p['report_bytes']}.md", p["report_bytes"])
+
+
+def prep_none(d, p):
+    return d
+
+
+def setup_load_logs(path, p):
+    import log_monitor
+    return lambda: log_monitor.load_logs(path), p["audit_lines"], "lines"
+
+
+def setup_analyze(path, p):
+    import log_monitor
+    entries = log_monitor.load_logs(path)
+    return lambda: log_monitor.analyze(entries), len(entries), "lines"
+
+
+def setup_generate_report(path, p):
+    import log_monitor
+    results = log_monitor.analyze(log_monitor.load_logs(path))
+    return lambda: log_monitor.generate_report(results), results["total"], "lines"
+
+
+def setup_heartbeat_report(_, p):
+    import heartbeat_monitor
+    n = p["heartbeat_agents"]
+    status = {f"agent-{i}": {"last_seen": "2026-03-01T00:00:00+00:00", "last_ts": 0, "state": "online" if i % 3 else "offline"}
+              for i in range(n)}
+    alerts = [{"agent": f"agent-{i}", "hours": 3.5} for i in range(0, n, 3)]
+    return lambda: heartbeat_monitor.generate_report(status, alerts), n, "agents"
+
+
+def setup_get_reports(ws, p):
+    import unified_dashboard
+    files = sum(1 for _ in (ws / "reports").rglob("*.md"))
+    return lambda: unified_dashboard.get_reports(ws), files, "files"
+
+
+def setup_trending(path, p):
+    import ai_research
+    raw = path.read_text()
+    ai_research.fetch = lambda url, accept=None: raw
+    return lambda: ai_research.github_trending("daily"), len(raw), "bytes"
+
+
+def setup_arxiv(path, p):
+    import ai_research
+    raw = path.read_text()
+    ai_research.fetch = lambda url, accept=None: raw
+    return lambda: ai_research.arxiv_papers("LLM agent", max_results=p["arxiv_entries"]), len(raw), "bytes"
+
+
+class _FixtureResponse(io.BytesIO):
+    """Stands in for the urlopen() response so pr_reviewer runs without network."""
+
+
+def setup_pr_diff(path, p):
+    import pr_reviewer
+    raw = path.read_bytes()
+    pr_reviewer.urllib.request.urlopen = lambda req, timeout=None: _FixtureResponse(raw)
+    return lambda: pr_reviewer.get_pr_diff(1), len(raw), "bytes"
+
+
+def setup_sanitize_config(path, p):
+    import sanitize_config
+    dst = path.with_suffix(".sanitized.json")
+    return lambda: sanitize_config.sanitize_file(path, dst), path.stat().st_size, "bytes"
+
+
+def setup_secret_scanner(path, p):
+    import secret_scanner
+    dst = path.with_suffix(".redacted.md")
+    return lambda: secret_scanner.redact_file(path, dst), path.stat().st_size, "bytes"
+
+
+def setup_sync_noop(src, p):
+    import incremental_sync
+    repo = src.with_name(src.name + "-repo")
+    shutil.rmtree(repo, ignore_errors=True)
+    sources = [(src / "reports", "agents/coding-agent/reports", "tree"),
+               (src / "memory", "agents/coding-agent/memory", "tree")]
+    _, manifest, _ = incremental_sync.sync(repo, {}, {}, sources)
+    return lambda: incremental_sync.sync(repo, manifest, {}, sources), len(manifest), "files"
+
+
+BENCHMARKS = {
+    "log_monitor.load_logs": (prep_audit, setup_load_logs),
+    "log_monitor.analyze": (prep_audit, setup_analyze),
+    "log_monitor.generate_report": (prep_audit, setup_generate_report),
+    "heartbeat_monitor.generate_report": (prep_none, setup_heartbeat_report),
+    "unified_dashboard.get_reports": (prep_workspace, setup_get_reports),
+    "ai_research.github_trending": (prep_trending, setup_trending),
+    "ai_research.arxiv_papers": (prep_arxiv, setup_arxiv),
+    "pr_reviewer.get_pr_diff": (prep_diff, setup_pr_diff),
+    "sanitize_config.sanitize_file": (prep_config, setup_sanitize_config),
+    "secret_scanner.redact_file": (prep_report, setup_secret_scanner),
+    "incremental_sync.sync_noop": (prep_sync_tree, setup_sync_noop),
+}
+
+
+# ─────────────────────────────────────────────
+# Runner
+# ─────────────────────────────────────────────
+
+def _child(name, fixture, params, repeat, conn):
+    try:
+        fn, units, unit = BENCHMARKS[name][1](fixture, params)
+        # setup 阶段（加载夹具等）的内存不计入被测入口
+        rss_setup = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        times = []
+        for _ in range(repeat):
+            t = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - t)
+        best = min(times)
+        rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # 额外跑一次不计时的 tracemalloc，得到入口自身的峰值分配
+        tracemalloc.start()
+        fn()
+        alloc_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        conn.send({
+            "wall_s": best,
+            "throughput": units / best if best else 0.0,
+            "unit": unit,
+            "alloc_peak_kb": alloc_peak // 1024,
+            "rss_delta_kb": rss_peak - rss_setup,
+        })
+    except Exception as e:
+        conn.send({"error": f"{type(e).__name__}: {e}"})
+    finally:
+        conn.close()
+
+
+def run_benchmark(name, data_dir, params, repeat):
+    """Run one benchmark in a fresh spawned process so memory numbers are per entry point."""
+    fixture = BENCHMARKS[name][0](data_dir, params)
+    ctx = multiprocessing.get_context("spawn")
+    parent, child = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_child, args=(name, fixture, params, repeat, child))
+    proc.start()
+    child.close()
+    try:
+        result = parent.recv()
+    except EOFError:
+        result = {"error": "benchmark process died"}
+    proc.join()
+    return result
+
+
+def load_baseline(path):
+    if path.exists():
+        try:
+            return json.loads(path.read_text())
+        except Exception:
+            pass
+    return {}
+
+
+def save_baseline(path, scale, results):
+    baseline = load_baseline(path)
+    baseline.setdefault(scale, {}).update({k: v for k, v in results.items() if "error" not in v})
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+
+
+def compare(result, base, tolerance):
+    """Return list of regression descriptions for one benchmark."""
+    problems = []
+    if not base or "error" in result:
+        return problems
+    for key, label in (("wall_s", "耗时"), ("alloc_peak_kb", "峰值分配"), ("rss_delta_kb", "RSS 增量")):
+        if key not in result or not base.get(key):
+            continue
+        if key.endswith("_kb") and result[key] - base[key] < MEMORY_SLACK_KB:
+            continue
+        if result[key] > base[key] * (1 + tolerance):
+            problems.append(f"{label} +{(result[key] / base[key] - 1) * 100:.0f}%")
+    return problems
+
+
+def fmt_rate(rate, unit):
+    for scale, suffix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+        if rate >= scale:
+            return f"{rate / scale:.1f}{suffix} {unit}/s"
+    return f"{rate:.1f} {unit}/s"
+
+
+def generate_report(scale, results, baseline, tolerance):
+    lines = [
+        f"# OpenClaw 基准测试（{scale}）",
+        "",
+        "| 基准 | 耗时 | 吞吐 | 峰值分配 | RSS 增量 | 对比基线 |",
+        "|------|------|------|----------|----------|----------|",
+    ]
+    regressions = errors = 0
+    for name, r in results.items():
+        if "error" in r:
+            errors += 1
+            lines.append(f"| `{name}` | — | — | — | — | ❌ {r['error']} |")
+            continue
+        base = baseline.get(name)
+        problems = compare(r, base, tolerance)
+        regressions += bool(problems)
+        if problems:
+            verdict = "⚠️ 回退：" + "，".join(problems)
+        elif base:
+            verdict = f"✅ {(r['wall_s'] / base['wall_s'] - 1) * 100:+.0f}%"
+        else:
+            verdict = "— 无基线"
+        lines.append(f"| `{name}` | {r['wall_s'] * 1000:.1f} ms | {fmt_rate(r['throughput'], r['unit'])} "
+                     f"| {r['alloc_peak_kb'] / 1024:.1f} MiB | {r['rss_delta_kb'] / 1024:.1f} MiB | {verdict} |")
+    return "\n".join(lines), regressions, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenClaw benchmark suite")
+    parser.add_argument("--scale", default="small", choices=list(SCALES),
+                        help="数据规模（默认：small；large 为 1000 万行审计日志）")
+    parser.add_argument("--only", default="*",
+                        help="只运行名称匹配的基准（glob，如 'log_monitor.*'）")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="每个基准重复次数，取最快一次（默认：3）")
+    parser.add_argument("--data-dir", default=str(DATA_DIR),
+                        help=f"合成数据缓存目录（默认：{DATA_DIR}）")
+    parser.add_argument("--baseline", default=str(BASELINE_FILE),
+                        help="基线文件路径")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="允许的回退比例（默认：0.25）")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="将本次结果写入基线")
+    parser.add_argument("--output", default=None,
+                        help="将结果 JSON 保存到文件")
+    args = parser.parse_args()
+
+    params = SCALES[args.scale]
+    data_dir = Path(args.data_dir) / args.scale
+    data_dir.mkdir(parents=True, exist_ok=True)
+    baseline_path = Path(args.baseline)
+
+    results = {}
+    for name in BENCHMARKS:
+        if not fnmatch.fnmatch(name, args.only):
+            continue
+        print(f"⏱️  {name}...", flush=True)
+        results[name] = run_benchmark(name, data_dir, params, args.repeat)
+
+    baseline = load_baseline(baseline_path).get(args.scale, {})
+    report, regressions, errors = generate_report(args.scale, results, baseline, args.tolerance)
+    print("\n" + report)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({"scale": args.scale, "results": results}, indent=2))
+    if args.save_baseline:
+        save_baseline(baseline_path, args.scale, results)
+        print(f"✅ 基线已保存：{baseline_path}")
+    # 入口报错说明工具已损坏，无论是否保存基线都要失败
+    if errors:
+        print(f"❌ {errors} 项基准运行失败")
+        sys.exit(EXIT_ERROR)
+    if regressions and not args.save_baseline:
+        print(f"⚠️ {regressions} 项基准超出基线 {args.tolerance:.0%}")
+        sys.exit(EXIT_REGRESSION)
+
+
+if __name__ == "__main__":
+    main()
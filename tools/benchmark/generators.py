@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Synthetic OpenClaw Workloads
+Deterministic data generators for the benchmark suite: audit logs, workspaces,
+GitHub Trending / arXiv fixtures, PR diffs, configs and reports with secrets.
+Same (name, size, seed) always produces byte-identical output. Cached fixture names carry
+a key of GENERATOR_VERSION, the generator's source and its parameters, so stale data is never reused.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 修改共享常量（WORDS、BASE_TIME 等）或辅助函数后需递增
+GENERATOR_VERSION = 1
+BASE_TIME = datetime(2026, 3, 1, tzinfo=timezone.utc)
+EVENTS = ["config.write", "config.write", "config.write", "config.migrate", "config.restore"]
+GATEWAY_MODES = ["local", "local", "local", "remote", None]
+WORDS = ("agent memory report cron gateway session model token provider research coding "
+         "heartbeat dashboard sync review trending arxiv paper briefing workspace config").split()
+FAKE_SECRETS = [
+    "ghp_" + "Ab1Cd2Ef3Gh4Ij5Kl6Mn7Op8Qr9St0UvWxYz",
+    "123456789:AAHdqTcvCH1vGWJxfSeofSAs0K5PALDsaw7",
+    "sk-proj-" + "q7Lm2Xv9Rt4Wn8Kp3Zs6Yb1Hc5",
+]
+
+
+def _hex(rng, n):
+    return "%0*x" % (n, rng.getrandbits(n * 4))
+
+
+def _sentence(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def _done(path):
+    return Path(str(path) + ".complete")
+
+
+def _fixture_key(gen, bound):
+    h = hashlib.sha256()
+    h.update(f"{GENERATOR_VERSION}|{gen.__name__}|{inspect.getsource(gen)}".encode())
+    h.update(repr(sorted((k, v) for k, v in bound.arguments.items() if k != "path")).encode())
+    return h.hexdigest()[:10]
+
+
+def cached(gen):
+    """
+    Skip generation when the output (and its .complete marker) already exists.
+    The returned path is the requested one with a fixture key inserted before the suffix.
+    """
+    sig = inspect.signature(gen)
+
+    def wrapper(path, *args, **kwargs):
+        path = Path(path)
+        bound = sig.bind(path, *args, **kwargs)
+        bound.apply_defaults()
+        path = path.with_name(f"{path.stem}-{_fixture_key(gen, bound)}{path.suffix}")
+        if not _done(path).exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            gen(path, *args, **kwargs)
+            _done(path).touch()
+        return path
+    wrapper.__name__ = gen.__name__
+    wrapper.__doc__ = gen.__doc__
+    return wrapper
+
+
+@cached
+def audit_log(path, lines, seed=0):
+    """config-audit.jsonl with `lines` entries, ~1% of them flagged suspicious."""
+    rng = random.Random(seed)
+    prev_hash = _hex(rng, 64)
+    size = 20000
+    batch = []
+    with open(path, "w") as f:
+        for i in range(lines):
+            next_hash = _hex(rng, 64)
+            next_size = size + rng.randint(-200, 400)
+            entry = {
+                "ts": (BASE_TIME + timedelta(seconds=i * 7)).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+                "event": rng.choice(EVENTS),
+                "previousHash": prev_hash,
+                "nextHash": next_hash,
+                "previousBytes": size,
+                "nextBytes": next_size,
+                "result": "rename",
+            }
+            mode = rng.choice(GATEWAY_MODES)
+            if mode:
+                entry["gatewayModeAfter"] = mode
+            if rng.random() < 0.01:
+                entry["suspicious"] = ["size-drop"]
+            batch.append(json.dumps(entry))
+            prev_hash, size = next_hash, next_size
+            if len(batch) >= 10000:
+                f.write("\n".join(batch) + "\n")
+                batch.clear()
+        if batch:
+            f.write("\n".join(batch) + "\n")
+
+
+@cached
+def workspace(path, reports, daily, memory, seed=0):
+    """Agent workspace with reports/*.md, reports/daily/*.md and memory/*.md, deterministic mtimes."""
+    rng = random.Random(seed)
+    (path / "reports" / "daily").mkdir(parents=True, exist_ok=True)
+    (path / "memory").mkdir(parents=True, exist_ok=True)
+    (path / "SOUL.md").write_text("# SOUL\n")
+    base = BASE_TIME.timestamp()
+    layout = [("reports/report-%06d.md", reports), ("reports/daily/%06d.md", daily), ("memory/mem-%06d.md", memory)]
+    for pattern, count in layout:
+        for i in range(count):
+            f = path / (pattern % i)
+            f.write_text(f"# {_sentence(rng, 4)}\n\n{_sentence(rng, 40)}\n")
+            t = base + rng.randint(0, 86400 * 90)
+            os.utime(f, (t, t))
+
+
+@cached
+def trending_html(path, repos, seed=0):
+    """GitHub Trending page fixture with `repos` repository rows."""
+    rng = random.Random(seed)
+    parts = ["<html><head><title>Trending</title></head><body>",
+             '<a href="/login">Sign in</a><a href="/trending">Trending</a><a href="/explore">Explore</a>']
+    for i in range(repos):
+        slug = f"{rng.choice(WORDS)}-org{i}/{rng.choice(WORDS)}-{i}"
+        parts.append(
+            f'<article class="Box-row"><h2><a href="/{slug}">{slug}</a></h2>'
+            f'<p class="col-9 color-fg-muted my-1 pr-4">\n  {_sentence(rng, 12)} &amp; more\n</p>'
+            f'<a href="/{slug}/stargazers">{rng.randint(1000, 90000):,}</a>'
+            f'<span class="d-inline-block float-sm-right">{rng.randint(10, 5000):,} stars today</span></article>'
+        )
+    parts.append("</body></html>")
+    path.write_text("\n".join(parts))
+
+
+@cached
+def arxiv_atom(path, entries, seed=0):
+    """arXiv API Atom feed fixture with `entries` papers."""
+    rng = random.Random(seed)
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>', '<feed xmlns="http://www.w3.org/2005/Atom">']
+    for i in range(entries):
+        published = (BASE_TIME - timedelta(days=i % 365)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        authors = "".join(f"<author><name>Author {rng.randint(1, 9999)}</name></author>" for _ in range(rng.randint(1, 6)))
+        parts.append(
+            f"<entry><id>http://arxiv.org/abs/2603.{i:05d}v1</id>"
+            f"<published>{published}</published>"
+            f"<title>{_sentence(rng, 8).title()}\n  &amp; {_sentence(rng, 3)}</title>"
+            f"<summary>{_sentence(rng, 150)}</summary>{authors}</entry>"
+        )
+    parts.append("</feed>")
+    path.write_text("\n".join(parts))
+
+
+@cached
+def pr_diff(path, lines, seed=0):
+    """Unified diff of roughly `lines` lines spread over files of 200-line hunks."""
+    rng = random.Random(seed)
+    with open(path, "w") as f:
+        written = n = 0
+        while written < lines:
+            name = f"tools/{rng.choice(WORDS)}/{rng.choice(WORDS)}_{n}.py"
+            f.write(f"diff --git a/{name} b/{name}\nindex {_hex(rng, 7)}..{_hex(rng, 7)} 100644\n"
+                    f"--- a/{name}\n+++ b/{name}\n@@ -1,200 +1,200 @@\n")
+            for _ in range(200):
+                f.write(rng.choice("+- ") + f"    {rng.choice(WORDS)} = {rng.choice(WORDS)}({rng.randint(0, 999)})\n")
+            written += 205
+            n += 1
+
+
+@cached
+def config(path, providers, seed=0):
+    """openclaw.json-shaped config with `providers` model providers and secrets in keys and values."""
+    rng = random.Random(seed)
+    data = {
+        "meta": {"lastTouchedVersion": "2026.2.26", "lastTouchedAt": "2026-03-02T07:31:26.940Z"},
+        "gateway": {"mode": "local", "auth": {"token": _hex(rng, 48)}},
+        "channels": {"telegram": {"botToken": FAKE_SECRETS[1], "allowFrom": [str(rng.randint(10**9, 10**10))]}},
+        "models": {"providers": {}},
+    }
+    for i in range(providers):
+        data["models"]["providers"][f"provider-{i}"] = {
+            "baseUrl": f"https://api.{rng.choice(WORDS)}{i}.example.com/v1",
+            "apiKey": "sk-" + _hex(rng, 40),
+            "api": "openai-completions",
+            "notes": _sentence(rng, 12) + (" " + FAKE_SECRETS[i % 3] if i % 10 == 0 else ""),
+            "models": [{"id": f"model-{i}-{j}", "name": _sentence(rng, 2), "contextWindow": 200000,
+                        "maxTokens": 8192} for j in range(5)],
+        }
+    path.write_text(json.dumps(data, indent=2))
+
+
+@cached
+def report_text(path, size_bytes, seed=0):
+    """Markdown report of ~size_bytes with a fake secret in ~1 of every 500 lines."""
+    rng = random.Random(seed)
+    written = 0
+    with open(path, "w") as f:
+        while written < size_bytes:
+            line = f"- {_sentence(rng, rng.randint(6, 20))} `{_hex(rng, 8)}` https://github.com/{rng.choice(WORDS)}/x"
+            if rng.random() < 0.002:
+                line += " " + rng.choice(FAKE_SECRETS)
+            f.write(line + "\n")
+            written += len(line) + 1
+
+
+def digest(path):
+    """sha256 of a generated file, for checking determinism."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
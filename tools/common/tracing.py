@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Hot-path Tracing
+Shared span timers for all tools. Disabled by default: span() returns a shared no-op
+and @traced functions cost one flag check. Enabled via each tool's --profile flag,
+which appends per-stage timings to a JSONL trace file and can dump cProfile stats.
+
+Usage in a tool:
+    from tracing import add_profile_args, run_profiled, span, traced
+
+    @traced()
+    def load_logs(path): ...
+
+    with span("fetch", url=url): ...
+
+    run_profiled(main, args, "log_monitor")
+"""
+
+import atexit
+import cProfile
+import functools
+import json
+import os
+import time
+from pathlib import Path
+
+TRACE_FILE = Path("/root/.openclaw/logs/profile.jsonl")
+
+_enabled = False
+_sink = None
+_tool = ""
+_stack = []
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "fields", "ts", "start")
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+
+    def __enter__(self):
+        _stack.append(self.name)
+        self.ts = time.time()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        ms = (time.perf_counter() - self.start) * 1000
+        _stack.pop()
+        record = {
+            "tool": _tool,
+            "span": self.name,
+            "parent": _stack[-1] if _stack else None,
+            "ts": round(self.ts, 6),
+            "ms": round(ms, 3),
+            "pid": os.getpid(),
+        }
+        if exc_type is SystemExit:
+            record["exit"] = exc.code
+        elif exc_type is not None:
+            record["error"] = exc_type.__name__
+        record.update(self.fields)
+        if _sink is not None:
+            _sink.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        return False
+
+
+def enabled():
+    return _enabled
+
+
+def span(name, **fields):
+    """Time a block as a named stage; extra fields are written into the trace record."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, fields)
+
+
+def traced(name=None):
+    """Decorator form of span(); defaults to the function name."""
+    def deco(fn):
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(label, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+def enable(tool, path=TRACE_FILE):
+    global _enabled, _sink, _tool
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _sink = open(path, "a", encoding="utf-8")
+    _tool = tool
+    _enabled = True
+    atexit.register(disable)
+
+
+def disable():
+    global _enabled, _sink
+    _enabled = False
+    if _sink is not None:
+        _sink.close()
+        _sink = None
+
+
+def add_profile_args(parser):
+    parser.add_argument("--profile", nargs="?", const=str(TRACE_FILE), default=None, metavar="TRACE_FILE",
+                        help=f"记录各阶段耗时到 JSONL（默认：{TRACE_FILE}）")
+    parser.add_argument("--profile-stats", default=None, metavar="FILE",
+                        help="同时保存 cProfile 统计（可用 python3 -m pstats 查看）")
+
+
+def run_profiled(main, args, tool):
+    """Run main() under a root span when --profile/--profile-stats was given; otherwise call it directly."""
+    if not args.profile and not args.profile_stats:
+        return main()
+    enable(tool, args.profile or TRACE_FILE)
+    profiler = cProfile.Profile() if args.profile_stats else None
+    try:
+        with _Span("main", {}):
+            if profiler is None:
+                return main()
+            return profiler.runcall(main)
+    finally:
+        if profiler is not None:
+            profiler.dump_stats(args.profile_stats)
+        disable()
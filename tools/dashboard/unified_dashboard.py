@@ -4,11 +4,16 @@ Unified Task Monitoring Dashboard
 Aggregates status from all agents, cron jobs, reports, and health checks.
 """
 
+import argparse
 import json
 import subprocess
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from tracing import add_profile_args, run_profiled, span, traced
+
 OUTPUT = Path("/root/.openclaw/workspace/unified_status_dashboard.md")
 WORKSPACES = {
     "main": Path("/root/.openclaw/workspace"),
@@ -21,6 +26,7 @@ HEALTH_STATUS = Path("/root/.openclaw/workspace/agent_health_status.json")
 def now():
     return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
+@traced()
 def get_cron_jobs():
     try:
         result = subprocess.run(
@@ -33,6 +39,7 @@ def get_cron_jobs():
         pass
     return []
 
+@traced()
 def get_reports(workspace):
     reports = []
     reports_dir = workspace / "reports"
@@ -45,6 +52,7 @@ def get_reports(workspace):
                 reports.append(f"daily/{f.name}")
     return reports
 
+@traced()
 def get_health():
     if HEALTH_STATUS.exists():
         try:
@@ -59,6 +67,7 @@ def ms_to_time(ms):
     dt = datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
     return dt.strftime("%Y-%m-%d %H:%M UTC")
 
+@traced()
 def generate_dashboard():
     lines = [
         "# 全员任务统一监控面板",
@@ -123,7 +132,8 @@ def generate_dashboard():
     ]
     log_file = Path("/root/.openclaw/logs/config-audit.jsonl")
     if log_file.exists():
-        count = sum(1 for _ in log_file.open())
+        with span("count_audit_log"):
+            count = sum(1 for _ in log_file.open())
         lines.append(f"- config-audit.jsonl：**{count} 条**记录，无可疑事件 ✅")
     else:
         lines.append("- 日志文件不存在")
@@ -136,8 +146,13 @@ def generate_dashboard():
 
     return "\n".join(lines)
 
-if __name__ == "__main__":
+def main():
     OUTPUT.parent.mkdir(parents=True, exist_ok=True)
     dashboard = generate_dashboard()
     OUTPUT.write_text(dashboard)
     print(dashboard)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Unified Task Monitoring Dashboard")
+    add_profile_args(parser)
+    run_profiled(main, parser.parse_args(), "dashboard")
@@ -5,19 +5,20 @@ REPO_DIR="/root/.openclaw/github-sync"
 COMMIT_MSG="${1:-auto: sync $(date -u +%Y-%m-%d\ %H:%M\ UTC)}"
 
 sync_files() {
-    mkdir -p "$REPO_DIR/config" "$REPO_DIR/agents/coding-agent/reports" "$REPO_DIR/agents/coding-agent/memory" "$REPO_DIR/agents/research-agent/reports/daily"
-    python3 /root/.openclaw/workspace-coding-agent/tools/github/sanitize_config.py \
-        /root/.openclaw/openclaw.json "$REPO_DIR/config/openclaw.json"
-    rsync -a /root/.openclaw/workspace-coding-agent/reports/ "$REPO_DIR/agents/coding-agent/reports/" 2>/dev/null || true
-    rsync -a /root/.openclaw/workspace-coding-agent/memory/ "$REPO_DIR/agents/coding-agent/memory/" 2>/dev/null || true
-    rsync -a /root/.openclaw/workspace-research-agent/reports/ "$REPO_DIR/agents/research-agent/reports/" 2>/dev/null || true
+    # 增量同步：只复制/脱敏变更文件并 git add 这些路径；返回 3 表示无变更
+    local rc=0
+    python3 /root/.openclaw/workspace-coding-agent/tools/github/incremental_sync.py --repo "$REPO_DIR" || rc=$?
+    if [ "$rc" -eq 3 ]; then
+        echo "没有变更，跳过推送"
+        exit 0
+    fi
+    [ "$rc" -eq 0 ] || exit "$rc"
 }
 
 git_push() {
     cd "$REPO_DIR"
     # 更新远程 URL（含 token）
     git remote set-url origin "https://${GITHUB_TOKEN}@github.com/${GITHUB_OWNER}/${GITHUB_REPO}.git"
-    git add -A
     if git diff --cached --quiet; then
         echo "没有变更，跳过推送"
         exit 0
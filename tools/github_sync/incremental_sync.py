@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Incremental Sync Engine
+增量同步：按清单（路径、大小、mtime、内容哈希）只复制/脱敏有变化的文件，并只暂存这些路径。
+报告与记忆文件经 secret_scanner 流式脱敏后写入仓库。
+
+Usage:
+    python3 incremental_sync.py --repo /root/.openclaw/github-sync
+    python3 incremental_sync.py --full   # 忽略清单，全部重新比对
+
+Exit codes:
+    0  有变更，已复制并 git add
+    3  清单显示无变更，调用方应跳过 commit/push
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from sanitize_config import sanitize_file
+from secret_scanner import PATTERNS_VERSION, load_clean_cache, redact_files, save_clean_cache
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from tracing import add_profile_args, run_profiled, span, traced
+
+REPO_DIR = Path("/root/.openclaw/github-sync")
+MANIFEST_FILE = Path("/root/.openclaw/workspace-coding-agent/tools/github/sync_manifest.json")
+MANIFEST_VERSION = 1
+# (源路径, 仓库内目标路径, 类型)
+SYNC_SOURCES = [
+    (Path("/root/.openclaw/openclaw.json"), "config/openclaw.json", "config"),
+    (Path("/root/.openclaw/workspace-coding-agent/reports"), "agents/coding-agent/reports", "tree"),
+    (Path("/root/.openclaw/workspace-coding-agent/memory"), "agents/coding-agent/memory", "tree"),
+    (Path("/root/.openclaw/workspace-research-agent/reports"), "agents/research-agent/reports", "tree"),
+]
+HASH_CHUNK = 1 << 20
+GIT_ADD_BATCH = 500
+EXIT_NO_CHANGES = 3
+
+
+@traced()
+def load_manifest(path, repo_dir):
+    if path.exists():
+        try:
+            data = json.loads(path.read_text())
+            # 密钥规则变化后需要重新脱敏全部文件；清单只对记录它的仓库有效
+            if (data.get("version") == MANIFEST_VERSION and data.get("scanner") == PATTERNS_VERSION
+                    and data.get("repo") == str(Path(repo_dir).resolve())):
+                return data.get("files", {})
+        except Exception:
+            pass
+    return {}
+
+
+@traced()
+def save_manifest(path, repo_dir, files):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    data = {"version": MANIFEST_VERSION, "scanner": PATTERNS_VERSION, "repo": str(Path(repo_dir).resolve()), "files": files}
+    tmp.write_text(json.dumps(data, separators=(",", ":")))
+    os.replace(tmp, path)
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def walk_files(root):
+    """Yield (path, stat) for every regular file under root, without following symlinks."""
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except FileNotFoundError:
+                        continue  # 扫描后被删除或改名，下次运行再同步
+                    yield Path(entry.path), st
+
+
+def iter_sources(sources):
+    """Yield (src, rel_dst, kind, stat) for every file that should be mirrored."""
+    for src, dst, kind in sources:
+        if kind == "tree":
+            if not src.is_dir():
+                continue
+            for path, st in walk_files(src):
+                yield path, f"{dst}/{path.relative_to(src).as_posix()}", kind, st
+        else:
+            try:
+                yield src, dst, kind, src.stat()
+            except OSError:
+                continue
+
+
+@traced()
+def sync(repo_dir, manifest, clean_cache=None, sources=SYNC_SOURCES):
+    """
+    Mirror changed files into repo_dir; return (changed_paths, new_manifest, redacted).
+    With clean_cache=None the scanner's clean-hash cache is loaded (and saved) only when files need redacting.
+    """
+    changed = []
+    files = {}
+    jobs = []
+    for src, rel, kind, st in iter_sources(sources):
+        entry = manifest.get(rel)
+        dst = repo_dir / rel
+        # 目标缺失（仓库重新克隆、文件被 git rm）时即使源未变也要重新复制
+        if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns and dst.exists():
+            files[rel] = entry
+            continue
+        # 源文件在扫描后消失时跳过且不写入清单，下次运行重试
+        try:
+            digest = file_sha256(src)
+        except FileNotFoundError:
+            continue
+        files[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+        if entry and entry["sha256"] == digest and dst.exists():
+            continue  # 仅 mtime 变化，内容未变
+        if kind == "config":
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                with span("sanitize_config"):
+                    sanitize_file(src, dst)
+            except FileNotFoundError:
+                del files[rel]
+                continue
+        else:
+            jobs.append((src, dst, digest))
+        changed.append(rel)
+    redacted = {}
+    if jobs:
+        # 缓存文件可达数 MB，无变更时不加载
+        persist = clean_cache is None
+        if persist:
+            clean_cache = load_clean_cache()
+        cache_size = len(clean_cache)
+        missing = []
+        with span("redact_files", files=len(jobs)):
+            redacted = redact_files(jobs, clean_cache, missing=missing)
+        if persist and len(clean_cache) != cache_size:
+            save_clean_cache(clean_cache)
+        if missing:
+            gone = {dst.relative_to(repo_dir).as_posix() for dst in missing}
+            changed = [rel for rel in changed if rel not in gone]
+            for rel in gone:
+                del files[rel]
+    return changed, files, redacted
+
+
+@traced()
+def git_add(repo_dir, paths):
+    for i in range(0, len(paths), GIT_ADD_BATCH):
+        subprocess.run(
+            ["git", "-C", str(repo_dir), "add", "--", *paths[i:i + GIT_ADD_BATCH]],
+            check=True,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental GitHub sync engine")
+    parser.add_argument("--repo", default=str(REPO_DIR),
+                        help=f"同步仓库目录（默认：{REPO_DIR}）")
+    parser.add_argument("--manifest", default=str(MANIFEST_FILE),
+                        help="清单文件路径")
+    parser.add_argument("--full", action="store_true",
+                        help="忽略已有清单，重新哈希全部文件")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    run_profiled(lambda: run(args), args, "incremental_sync")
+
+
+def run(args):
+    repo_dir = Path(args.repo)
+    manifest_path = Path(args.manifest)
+    manifest = {} if args.full else load_manifest(manifest_path, repo_dir)
+
+    changed, files, redacted = sync(repo_dir, manifest)
+    for path, hits in redacted.items():
+        print(f"⚠️ 已脱敏 {path}: " + ", ".join(f"{k}×{v}" for k, v in hits.most_common()))
+    if changed:
+        git_add(repo_dir, changed)
+    # 清单在暂存成功后再落盘，失败时下次运行会重新检测这些文件
+    if files != manifest:
+        save_manifest(manifest_path, repo_dir, files)
+
+    if not changed:
+        print("清单无变更")
+        sys.exit(EXIT_NO_CHANGES)
+    print(f"已同步 {len(changed)} 个文件")
+
+
+if __name__ == "__main__":
+    main()
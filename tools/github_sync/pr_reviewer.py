@@ -4,6 +4,7 @@ GitHub PR Reviewer
 监听指定仓库的 PR，用 AI 进行代码评审，自动提交 Review 并 Telegram 通知 K
 """
 
+import argparse
 import json
 import os
 import sys
@@ -13,6 +14,9 @@ from pathlib import Path
 import urllib.request
 import urllib.error
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from tracing import add_profile_args, run_profiled, span, traced
+
 # 配置从环境变量读取
 GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN", "")
 REPO_OWNER = os.environ.get("GITHUB_OWNER", "")
@@ -28,13 +32,15 @@ def github_api(path, method="GET", data=None):
     }
     body = json.dumps(data).encode() if data else None
     req = urllib.request.Request(url, data=body, headers=headers, method=method)
-    try:
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            return json.loads(resp.read())
-    except urllib.error.HTTPError as e:
-        print(f"GitHub API 错误 {e.code}: {e.read().decode()}")
-        return None
-
+    with span("github_api", method=method, path=path.split("?")[0]):
+        try:
+            with urllib.request.urlopen(req, timeout=15) as resp:
+                return json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            print(f"GitHub API 错误 {e.code}: {e.read().decode()}")
+            return None
+
+@traced()
 def get_pr_diff(pr_number):
     url = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/pulls/{pr_number}"
     headers = {
@@ -48,15 +54,18 @@ def get_pr_diff(pr_number):
     except Exception as e:
         return f"无法获取 diff: {e}"
 
+@traced()
 def load_state():
     if STATE_FILE.exists():
         return json.loads(STATE_FILE.read_text())
     return {"reviewed": []}
 
+@traced()
 def save_state(state):
     STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
     STATE_FILE.write_text(json.dumps(state, indent=2))
 
+@traced()
 def review_with_ai(pr_title, pr_body, diff):
     """调用 openclaw 内置模型进行代码评审（通过 sessions_spawn 或本地推理）"""
     prompt = f"""你是一名资深代码评审专家。请对以下 PR 进行简洁的评审，重点关注：
@@ -88,6 +97,7 @@ PR 描述：{pr_body or '无'}
         pass
     return "自动评审不可用，请人工评审此 PR。"
 
+@traced()
 def post_review(pr_number, body):
     return github_api(
         f"/repos/{REPO_OWNER}/{REPO_NAME}/pulls/{pr_number}/reviews",
@@ -95,6 +105,7 @@ def post_review(pr_number, body):
         data={"body": body, "event": "COMMENT"}
     )
 
+@traced()
 def notify_k(pr_number, pr_title, review_summary):
     msg = f"🔍 **PR 评审完成 #{pr_number}**\n\n**标题：** {pr_title}\n\n**评审摘要：**\n{review_summary[:500]}\n\n[查看 PR](https://github.com/{REPO_OWNER}/{REPO_NAME}/pull/{pr_number})"
     subprocess.run([
@@ -133,4 +144,6 @@ def main():
     print(f"完成评审 {new_reviews} 个新 PR")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="GitHub PR Reviewer")
+    add_profile_args(parser)
+    run_profiled(main, parser.parse_args(), "pr_reviewer")
@@ -1,21 +1,29 @@
 #!/usr/bin/env python3
-"""脱敏处理 openclaw.json 中的 token 和密钥"""
+"""脱敏处理 openclaw.json 中的 token 和密钥（按键名 + 按值的密钥规则）"""
 import json, sys, re
 
-src = sys.argv[1]
-dst = sys.argv[2]
+from secret_scanner import redact_text
 
-with open(src) as f:
-    data = json.load(f)
+SECRET_KEY_RE = re.compile("token|secret|key|password|pat", re.I)
 
 def sanitize(obj):
     if isinstance(obj, dict):
-        return {k: "***REDACTED***" if any(s in k.lower() for s in ["token","secret","key","password","pat"]) else sanitize(v) for k, v in obj.items()}
+        return {k: "***REDACTED***" if SECRET_KEY_RE.search(k) else sanitize(v) for k, v in obj.items()}
     elif isinstance(obj, list):
         return [sanitize(i) for i in obj]
+    elif isinstance(obj, str):
+        return redact_text(obj)[0]
     return obj
 
-sanitized = sanitize(data)
-with open(dst, "w") as f:
-    json.dump(sanitized, f, indent=2, ensure_ascii=False)
-print(f"✅ 脱敏完成: {dst}")
+def sanitize_file(src, dst):
+    with open(src) as f:
+        data = json.load(f)
+    sanitized = sanitize(data)
+    with open(dst, "w") as f:
+        json.dump(sanitized, f, indent=2, ensure_ascii=False)
+
+if __name__ == "__main__":
+    src = sys.argv[1]
+    dst = sys.argv[2]
+    sanitize_file(src, dst)
+    print(f"✅ 脱敏完成: {dst}")
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Secret Scanner
+流式扫描文本/JSON 文件中的密钥（GitHub PAT、Telegram Bot Token、sk- 密钥、高熵字符串等），
+所有规则合并为一个正则一次匹配；内容哈希已确认干净的文件直接跳过。
+
+Usage:
+    python3 secret_scanner.py reports/ memory/          # 只检查，发现密钥时退出码 2
+    python3 secret_scanner.py --redact SRC DST          # 脱敏单个文件
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import shutil
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from tracing import add_profile_args, run_profiled, traced
+
+REDACTED = b"***REDACTED***"
+CLEAN_CACHE_FILE = Path("/root/.openclaw/workspace-coding-agent/tools/github/scanner_clean_cache.json")
+CLEAN_CACHE_MAX = 100000
+BUF_SIZE = 64 * 1024
+MAX_LINE = 1 << 20  # 超长无换行内容按此长度强制切分
+CUT_OVERLAP = 512  # 强制切分时回看的字节数，需大于最长的有界规则（github_pat 约 266 字节）
+PARALLEL_MIN = 8
+# 熵阈值取该字符集与长度下最大熵 log2(min(len, 字母表大小)) 的比例：
+# 随机 base62/base64 令牌约 99.9% 达标，带分隔符的标识符、路径通常在 0.77 以下
+ENTROPY_RATIO = 0.8
+HEX_MIN_LEN = 40
+# 恰为 git 提交 SHA（SHA-1/SHA-256）或 sha256 摘要长度的十六进制串视为哈希，报告中常引用
+HASH_HEX_LENS = (40, 64)
+
+# 顺序即优先级：同一位置先匹配到的规则生效，hex_secret/high_entropy 必须放最后
+# 所有规则都不得跨行：预筛选和流式切分都以行为单位
+SECRET_PATTERNS = [
+    ("github_pat", rb"github_pat_[A-Za-z0-9_]{22,255}"),
+    ("github_token", rb"gh[pousr]_[A-Za-z0-9]{36,255}"),
+    ("telegram_bot", rb"(?<![0-9])[0-9]{8,10}:[A-Za-z0-9_-]{35}(?![A-Za-z0-9_-])"),
+    ("sk_key", rb"(?<![A-Za-z0-9])sk-[A-Za-z0-9_-]{20,}"),
+    ("aws_key", rb"(?<![A-Z0-9])AKIA[0-9A-Z]{16}(?![A-Z0-9])"),
+    ("url_credential", rb"(?<=://)[^/\s@]{8,}(?=@)"),
+    ("assignment", rb"(?i:(?<![A-Za-z0-9])(?:token|secret|password|passwd|api[_-]?key))"
+                   rb"[\"']?[ \t]*[:=][ \t]*[\"']?(?P<assign_val>[^\s\"',;]{8,})"),
+    ("hex_secret", rb"(?<![A-Za-z0-9+_=-])(?:[0-9a-f]{%d,}|[0-9A-F]{%d,})(?![A-Za-z0-9+_=-])" % (HEX_MIN_LEN, HEX_MIN_LEN)),
+    ("high_entropy", rb"(?<![A-Za-z0-9+_=-])[A-Za-z0-9+_=-]{32,}"),
+]
+_ENTROPY_KINDS = ("hex_secret", "high_entropy")
+SECRET_RE = re.compile(b"|".join(b"(?P<%s>%s)" % (name.encode(), pat) for name, pat in SECRET_PATTERNS))
+# 高熵候选未达阈值时，用具体规则复查其内部（如 "x=ghp_..." 整段被候选吞掉）
+SPECIFIC_RE = re.compile(b"|".join(b"(?P<%s>%s)" % (name.encode(), pat) for name, pat in SECRET_PATTERNS
+                                   if name not in _ENTROPY_KINDS))
+# 规则变化后旧的“干净”结论失效
+PATTERNS_VERSION = hashlib.sha256(SECRET_RE.pattern + str((ENTROPY_RATIO, HASH_HEX_LENS)).encode()).hexdigest()[:16]
+
+# 预筛选：正则在 CPython 中逐位置尝试所有分支很慢，先用 C 级 translate/find 定位可能含密钥的行。
+# 除 url_credential（必含 @）和 assignment（关键字后紧跟 : 或 =）外，所有规则都包含 >=20 个连续 token 字符。
+_TOKEN_CHARS = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_+=-"
+_TOKEN_MASK = bytes(120 if c in _TOKEN_CHARS else 32 for c in range(256))
+_TOKEN_RUN = b"x" * 20
+_ASSIGN_KEYWORDS = (b"token", b"secret", b"passw", b"apikey", b"api_key", b"api-key")
+_ASSIGN_TAIL = re.compile(rb"[a-z]{0,3}[\"']?[ \t]*[:=]")
+_HEX_LOWER = set("0123456789abcdef")
+_HEX_UPPER = set("0123456789ABCDEF")
+
+
+def shannon_entropy(s):
+    n = len(s)
+    return -sum(c / n * math.log2(c / n) for c in Counter(s).values())
+
+
+def alphabet_size(s):
+    chars = set(s)
+    if chars <= _HEX_LOWER or chars <= _HEX_UPPER:
+        return 16
+    return (26 * any(c.islower() for c in chars) + 26 * any(c.isupper() for c in chars)
+            + 10 * any(c.isdigit() for c in chars) + 4 * any(c in "+_=-" for c in chars))
+
+
+def is_high_entropy(token):
+    s = token.decode("ascii")
+    # 不含数字的多为驼峰/下划线标识符
+    if not any(c.isdigit() for c in s):
+        return False
+    return shannon_entropy(s) >= ENTROPY_RATIO * math.log2(min(len(s), alphabet_size(s)))
+
+
+def _redactor(hits):
+    def repl(m):
+        kind = m.lastgroup
+        text = m.group()
+        if kind == "hex_secret" and len(text) in HASH_HEX_LENS:
+            return text
+        if kind in _ENTROPY_KINDS and not is_high_entropy(text):
+            return SPECIFIC_RE.sub(repl, text)
+        hits[kind] += 1
+        if kind == "assignment":
+            return text[:m.start("assign_val") - m.start()] + REDACTED
+        return REDACTED
+    return repl
+
+
+def _candidate_positions(block):
+    lower = block.lower()
+    searches = [(block.translate(_TOKEN_MASK), _TOKEN_RUN, None), (block, b"@", None)]
+    searches += [(lower, k, _ASSIGN_TAIL) for k in _ASSIGN_KEYWORDS]
+    positions = []
+    for hay, needle, tail in searches:
+        pos = hay.find(needle)
+        while pos != -1:
+            if tail is not None and not tail.match(hay, pos + len(needle)):
+                pos = hay.find(needle, pos + 1)
+                continue
+            positions.append(pos)
+            eol = block.find(b"\n", pos)
+            if eol == -1:
+                break
+            pos = hay.find(needle, eol + 1)
+    return sorted(positions)
+
+
+def redact_block(block, repl):
+    """Apply SECRET_RE only to the lines of block that pass the prefilter."""
+    positions = _candidate_positions(block)
+    if not positions:
+        return block
+    out = []
+    last = 0
+    for pos in positions:
+        if pos < last:
+            continue
+        start = block.rfind(b"\n", 0, pos) + 1
+        end = block.find(b"\n", pos)
+        end = len(block) if end == -1 else end + 1
+        out.append(block[last:start])
+        out.append(SECRET_RE.sub(repl, block[start:end]))
+        last = end
+    out.append(block[last:])
+    return b"".join(out)
+
+
+def redact_text(text):
+    """Return (redacted_text, Counter of hits by pattern name)."""
+    hits = Counter()
+    out = redact_block(text.encode("utf-8", "surrogateescape"), _redactor(hits))
+    return out.decode("utf-8", "surrogateescape"), hits
+
+
+def _safe_cut(pending):
+    """
+    Pick a forced cut point for a newline-free buffer that does not split a secret:
+    back off to a non-token byte, then before any match that straddles the cut.
+    """
+    cut = len(pending) - CUT_OVERLAP
+    while cut > 0 and _TOKEN_MASK[pending[cut - 1]] == 120 and _TOKEN_MASK[pending[cut]] == 120:
+        cut -= 1
+    if cut == 0:
+        cut = len(pending) - CUT_OVERLAP  # 整段都是 token 字符，只能靠下面的跨界检查
+    for m in SECRET_RE.finditer(pending, max(0, cut - CUT_OVERLAP), cut + CUT_OVERLAP):
+        if m.start() < cut < m.end():
+            cut = m.start()
+            break
+        if m.start() >= cut:
+            break
+    return cut if cut > 0 else len(pending)
+
+
+def is_binary(head):
+    # 与 git 相同的启发式：首个缓冲区含 NUL 即视为二进制
+    return b"\0" in head
+
+
+def redact_stream(fin, fout=None):
+    """
+    Redact fin (opened "rb") into fout in BUF_SIZE reads, cutting on line boundaries. fout=None only counts.
+    Binary content (NUL in the first buffer) is copied through unchanged and reports no hits.
+    """
+    hits = Counter()
+    repl = _redactor(hits)
+    pending = b""
+    chunk = fin.read(BUF_SIZE)
+    if is_binary(chunk):
+        while chunk:
+            if fout is not None:
+                fout.write(chunk)
+            chunk = fin.read(BUF_SIZE)
+        return hits
+    while chunk:
+        pending += chunk
+        chunk = fin.read(BUF_SIZE)
+        cut = pending.rfind(b"\n") + 1
+        if not cut:
+            if len(pending) < MAX_LINE:
+                continue
+            cut = _safe_cut(pending)
+        out = redact_block(pending[:cut], repl)
+        if fout is not None:
+            fout.write(out)
+        pending = pending[cut:]
+    if pending:
+        out = redact_block(pending, repl)
+        if fout is not None:
+            fout.write(out)
+    return hits
+
+
+@traced()
+def scan_file(path):
+    with open(path, "rb") as fin:
+        return redact_stream(fin)
+
+
+def redact_file(src, dst):
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        hits = redact_stream(fin, fout)
+    shutil.copystat(src, dst)
+    return hits
+
+
+@traced()
+def load_clean_cache(path=CLEAN_CACHE_FILE):
+    if path.exists():
+        try:
+            data = json.loads(path.read_text())
+            if data.get("patterns") == PATTERNS_VERSION:
+                return dict.fromkeys(data.get("clean", []))
+        except Exception:
+            pass
+    return {}
+
+
+@traced()
+def save_clean_cache(cache, path=CLEAN_CACHE_FILE):
+    clean = list(cache)[-CLEAN_CACHE_MAX:]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"patterns": PATTERNS_VERSION, "clean": clean}, separators=(",", ":")))
+    os.replace(tmp, path)
+
+
+def _redact_job(job):
+    src, dst, _ = job
+    try:
+        return redact_file(src, dst)
+    except FileNotFoundError:
+        return None  # 源文件已被删除或改名（临时文件 + rename 写入）
+
+
+def redact_files(jobs, cache, workers=None, missing=None):
+    """
+    Copy each (src, dst, sha256) job with secrets redacted.
+    Jobs whose sha256 is in cache are copied verbatim; newly verified clean hashes are added to cache.
+    Jobs whose src vanished meanwhile are skipped and their dst appended to missing (if given).
+    Returns {dst: Counter} for files that contained secrets.
+    """
+    if missing is None:
+        missing = []
+    todo = []
+    for src, dst, digest in jobs:
+        if digest in cache:
+            Path(dst).parent.mkdir(parents=True, exist_ok=True)
+            try:
+                shutil.copy2(src, dst)
+            except FileNotFoundError:
+                missing.append(dst)
+        else:
+            todo.append((src, dst, digest))
+
+    if len(todo) >= PARALLEL_MIN:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_redact_job, todo, chunksize=4))
+    else:
+        results = [_redact_job(job) for job in todo]
+
+    found = {}
+    for (src, dst, digest), hits in zip(todo, results):
+        if hits is None:
+            missing.append(dst)
+        elif hits:
+            found[str(dst)] = hits
+        else:
+            cache[digest] = None
+    return found
+
+
+def _is_binary_file(path):
+    with open(path, "rb") as f:
+        return is_binary(f.read(BUF_SIZE))
+
+
+def iter_paths(paths):
+    """Yield text files under paths; binary files are skipped."""
+    for p in map(Path, paths):
+        if p.is_dir():
+            yield from sorted(f for f in p.rglob("*") if f.is_file() and not _is_binary_file(f))
+        elif p.is_file() and not _is_binary_file(p):
+            yield p
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming multi-pattern secret scanner")
+    parser.add_argument("paths", nargs="+", help="要检查的文件或目录；--redact 模式下为 SRC DST")
+    parser.add_argument("--redact", action="store_true", help="脱敏 SRC 并写入 DST")
+    add_profile_args(parser)
+    args = parser.parse_args()
+    run_profiled(lambda: run(args, parser), args, "secret_scanner")
+
+
+def run(args, parser):
+    if args.redact:
+        if len(args.paths) != 2:
+            parser.error("--redact 需要 SRC DST 两个参数")
+        hits = redact_file(*args.paths)
+        print(f"✅ 脱敏完成: {args.paths[1]}（{sum(hits.values())} 处）")
+        return
+
+    found = 0
+    for path in iter_paths(args.paths):
+        hits = scan_file(path)
+        if hits:
+            found += 1
+            detail = ", ".join(f"{k}×{v}" for k, v in hits.most_common())
+            print(f"⚠️ {path}: {detail}")
+    if found:
+        print(f"发现 {found} 个文件含疑似密钥")
+        sys.exit(2)
+    print("✅ 未发现密钥")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,16 +4,21 @@ Cross-Agent Heartbeat Monitor
 Checks agent session status and alerts K if any agent is unresponsive.
 """
 
+import argparse
 import json
 import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from tracing import add_profile_args, run_profiled, traced
+
 STATUS_FILE = Path("/root/.openclaw/workspace/agent_health_status.json")
 ALERT_THRESHOLD_HOURS = 2
 AGENTS = ["main", "coding-agent", "learning-agent", "research-agent"]
 
+@traced()
 def load_status():
     if STATUS_FILE.exists():
         try:
@@ -22,6 +27,7 @@ def load_status():
             pass
     return {}
 
+@traced()
 def save_status(status):
     STATUS_FILE.parent.mkdir(parents=True, exist_ok=True)
     STATUS_FILE.write_text(json.dumps(status, indent=2))
@@ -32,6 +38,7 @@ def now_iso():
 def now_ts():
     return datetime.now(timezone.utc).timestamp()
 
+@traced()
 def check_agents():
     """Use openclaw sessions list to check agent activity."""
     try:
@@ -45,6 +52,7 @@ def check_agents():
         pass
     return None
 
+@traced()
 def generate_report(status, alerts):
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
     lines = [
@@ -72,7 +80,7 @@ def generate_report(status, alerts):
 
     return "\n".join(lines)
 
-if __name__ == "__main__":
+def main():
     status = load_status()
     now_t = now_ts()
     now_s = now_iso()
@@ -108,6 +116,9 @@ if __name__ == "__main__":
     report = generate_report(status, alerts)
     print(report)
 
-    if alerts:
-        sys.exit(2)  # Signal alerts exist
-    sys.exit(0)
+    return 2 if alerts else 0  # 2 signals alerts exist
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cross-Agent Heartbeat Monitor")
+    add_profile_args(parser)
+    sys.exit(run_profiled(main, parser.parse_args(), "heartbeat"))
@@ -4,14 +4,20 @@ OpenClaw Log Monitor
 Analyzes config-audit.jsonl and generates a Markdown report.
 """
 
+import argparse
 import json
+import sys
 from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "common"))
+from tracing import add_profile_args, run_profiled, span, traced
+
 LOG_PATH = Path("/root/.openclaw/logs/config-audit.jsonl")
 REPORT_PATH = Path("/root/.openclaw/workspace-coding-agent/reports/log_analysis_report.md")
 
+@traced()
 def load_logs(path):
     entries = []
     with open(path) as f:
@@ -24,6 +30,7 @@ def load_logs(path):
                     pass
     return entries
 
+@traced()
 def analyze(entries):
     results = {
         "total": len(entries),
@@ -54,6 +61,7 @@ def analyze(entries):
         })
     return results
 
+@traced()
 def generate_report(results):
     now = datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
     lines = [
@@ -120,10 +128,16 @@ def generate_report(results):
     ]
     return "\n".join(lines)
 
-if __name__ == "__main__":
+def main():
     entries = load_logs(LOG_PATH)
     results = analyze(entries)
     report = generate_report(results)
-    REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    REPORT_PATH.write_text(report)
+    with span("write_report"):
+        REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        REPORT_PATH.write_text(report)
     print(report)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OpenClaw Log Monitor")
+    add_profile_args(parser)
+    run_profiled(main, parser.parse_args(), "log_monitor")